@@ -31,6 +31,18 @@ Excel Calculation Flow:
 
 from __future__ import annotations
 
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the kernel as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from ber_automation.ber_engine.constants import (
     AIR_CHANGE_RATE,
     AIR_HEAT_CAPACITY,
@@ -63,13 +75,210 @@ from ber_automation.models import (
     BERResult,
     BuildingInput,
     BuildingType,
+    ConstructionEpoch,
+    Country,
     HeatingSystem,
     HWBResult,
     RetrofitInput,
-    WindowDoorAreas,
+)
+
+# --- lookup tables for the numeric kernel, indexed by enum position ---
+
+_EPOCH_IDX = {e: i for i, e in enumerate(ConstructionEpoch)}
+_COUNTRY_IDX = {c: i for i, c in enumerate(Country)}
+_HEATING_IDX = {h: i for i, h in enumerate(HeatingSystem)}
+_BTYPE_IDX = {bt: i for i, bt in enumerate(BuildingType)}
+
+# Columns: FE (windows), OD (roof), KD (floor), AW (external wall)
+_U_TABLE = np.array([[U_VALUES[e][k] for k in ("FE", "OD", "KD", "AW")] for e in ConstructionEpoch])
+_G_TABLE = np.array([G_VALUES[e] for e in ConstructionEpoch])
+_HDD_TABLE = np.array([HEATING_DEGREE_DAYS[c] for c in Country])
+_HEATING_DAYS_TABLE = np.array([HEATING_DAYS[c] for c in Country])
+# Columns: north, east, south, west
+_IRR_TABLE = np.array(
+    [[SOLAR_IRRADIANCE[c][o] for o in ("north", "east", "south", "west")] for c in Country]
+)
+_EFF_TABLE = np.array([HEATING_SYSTEM_EFFICIENCY[h] for h in HeatingSystem])
+_CO2_TABLE = np.array([CO2_FACTOR[h] for h in HeatingSystem])
+_PEF_TABLE = np.array([PRIMARY_ENERGY_FACTOR[h] for h in HeatingSystem])
+_WIN_FRAC_TABLE = np.array([WINDOW_AREA_FRACTION[bt] for bt in BuildingType])
+# Party-wall multiples of (length, width) per building type (Excel O2)
+_ADJ_TABLE = np.array([
+    {
+        BuildingType.SEMI_D_LENGTH: (1.0, 0.0),
+        BuildingType.SEMI_D_WIDTH: (0.0, 1.0),
+        BuildingType.TERRACED_LENGTH: (2.0, 0.0),
+        BuildingType.TERRACED_WIDTH: (0.0, 2.0),
+    }.get(bt, (0.0, 0.0))
+    for bt in BuildingType
+])
+
+# Field order of the HWBResult model, reused for the batch structured array
+_HWB_FIELDS = tuple(HWBResult.model_fields)
+BATCH_DTYPE = np.dtype(
+    [(name, np.float64) for name in _HWB_FIELDS]
+    + [("kwh_per_m2", np.float64), ("ber_band", "U2")]
 )
 
 
+@njit(cache=True, error_model="numpy")
+def _hwb_kernel(
+    length, width, storeys, storey_h,
+    u_win, u_roof, u_floor, u_wall, g,
+    adj_length, adj_width,
+    win_frac, win_north, win_east, win_south, win_west, win_fixed_total,
+    hdd, heating_days,
+    irr_north, irr_east, irr_south, irr_west,
+    residents, eff, hw_eff, co2_factor, co2_hw_factor,
+):
+    """HWB balance on plain floats or NumPy arrays (mirrors Excel Calculations row 2).
+
+    All enum lookups are resolved by the caller, so the body is pure numeric
+    code and is JIT-compiled when numba is installed.  Works elementwise, so
+    the same kernel serves :meth:`HWBCalculator.calculate` and the batch path.
+
+    Window/door areas are ``win_fixed_* + envelope * win_frac`` split equally
+    over the four orientations, so pass ``win_frac=0`` for buildings with
+    explicit areas and zeros for the fixed areas otherwise.  Party walls are
+    ``adj_length * length + adj_width * width`` per storey height.
+
+    Returns:
+        Tuple in ``HWBResult`` field order.
+    """
+    # --- Geometry (Excel Calculations C2-P2) ---
+    # C2: gross storey area
+    gross_area = length * width * storeys
+
+    # D2: net storey area = gross * 0.8
+    net_area = gross_area * NET_TO_GROSS_RATIO
+
+    # E2: envelope area (all exterior walls incl. windows)
+    #     = perimeter * storeys * storey_height
+    envelope_area = ((length + width) * 2) * storeys * storey_h
+
+    # K2, L2: roof and floor = single storey footprint
+    roof_area = length * width
+    floor_area = length * width
+
+    # O2: adjacent (party) walls
+    #     Semi-D: length or width * storeys * storey_height
+    #     Terraced: twice that; detached: 0
+    adjacent_walls = (adj_length * length + adj_width * width) * (storeys * storey_h)
+
+    # F2 / Input!J2: window/door total area
+    #     = envelope_area * fraction (0.15/0.14/0.13 by building type)
+    win_default = envelope_area * win_frac
+    a_win = win_fixed_total + win_default
+
+    # M2: total walls = envelope - windows
+    # N2: external walls = total walls - adjacent walls
+    external_walls = (envelope_area - a_win) - adjacent_walls
+
+    # G2-J2: window areas by orientation (K2 = J2 * (1/4), equal split)
+    quarter = win_default / 4.0
+
+    # P2: net inner volume
+    # Looking at formula: =D2*(Input!H2-0.35)*Input!G2
+    # C2 = E*F*G (length*width*storeys) = gross area INCLUDING storeys
+    # D2 = C2*0.8 = net area including all storeys
+    # P2 = D2 * (H2-0.35) * G2 = net_area * (height-0.35) * storeys
+    # That DOES double-count storeys.
+    # But in the Excel, this is the formula. Let me just follow it faithfully:
+    volume = net_area * (storey_h - FLOOR_THICKNESS) * storeys
+
+    # --- Transmission Heat Loss (Excel AT2-AV2) ---
+    # AT2: L_e = U_win*A_win*f_win + U_roof*A_roof*f_roof + U_floor*A_floor*f_floor + U_wall*A_extwall*f_wall
+    # f_win = 1, f_roof = 1, f_floor = 0.7, f_wall = 1
+    l_e = (
+        u_win * a_win * 1.0                     # AH2*AI2*AJ2
+        + u_roof * roof_area * 1.0              # AK2*AL2*AM2
+        + u_floor * floor_area * FLOOR_U_FACTOR  # AN2*AO2*AP2
+        + u_wall * external_walls * 1.0         # AQ2*AR2*AS2
+    )
+
+    # AU2: thermal bridge supplement
+    # =MAX(0.2*(0.75-(AT2/(AI2+AL2+AO2+AR2)))*AT2, 0)
+    total_area = a_win + roof_area + floor_area + external_walls
+    u_mean = l_e / total_area
+    l_psi = np.maximum(THERMAL_BRIDGE_FACTOR * (THERMAL_BRIDGE_REFERENCE - u_mean) * l_e, 0.0)
+
+    # AV2: total transmission coefficient
+    l_t = l_e + l_psi
+
+    # AW2: transmission heat loss (kWh/a)
+    q_t = HDD_TO_KWH_FACTOR * l_t * hdd
+
+    # --- Ventilation Heat Loss (Excel BA2-BC2) ---
+    # BA2 = P2 (volume)
+    # BB2 = 0.34 * 0.4 * BA2
+    l_v = AIR_HEAT_CAPACITY * AIR_CHANGE_RATE * volume
+
+    # BC2 = 0.024 * BB2 * AE2
+    q_v = HDD_TO_KWH_FACTOR * l_v * hdd
+
+    # --- Internal Gains (Excel BG2) ---
+    # BG2 = 0.024 * 3.75 * D2 * AF2
+    q_i = HDD_TO_KWH_FACTOR * INTERNAL_GAIN_RATE * net_area * heating_days
+
+    # --- Solar Gains (Excel BU2) ---
+    # BT2 = W2 * 0.9 * 0.98  (g_effective)
+    g_eff = g * FRAME_FACTOR * DIRT_FACTOR
+
+    # BU2 = (Irr_N*A_N + Irr_E*A_E + Irr_S*A_S + Irr_W*A_W) * F_s * g_eff
+    q_s = (
+        irr_north * (win_north + quarter)
+        + irr_east * (win_east + quarter)
+        + irr_south * (win_south + quarter)
+        + irr_west * (win_west + quarter)
+    ) * SHADING_FACTOR * g_eff
+
+    # --- Heating Demand (Excel BY2) ---
+    # BY2 = AW2 + BC2 - BG2 - BU2  (no utilisation factor!)
+    # In the Excel, this can go negative (no MAX(0,...) applied)
+    # But physically it should be >= 0
+    q_heating = np.maximum(q_t + q_v - q_i - q_s, 0.0)
+
+    # BZ2: specific = Q_heating / gross_area
+    hwb = q_heating / gross_area
+
+    # --- Hot Water (Excel CB2) ---
+    # CB2 = Input!P2 * 40 * 365 * (4.2/3600) * 45
+    # Input!P2 = Calculations!C2/52 = gross_area / 52
+    q_hotwater = (
+        residents
+        * HOT_WATER_LITRES_PER_PERSON_PER_DAY
+        * 365
+        * HOT_WATER_SPECIFIC_HEAT
+        * HOT_WATER_TEMP_RISE_K
+    )
+
+    # --- Final Energy ---
+    final_heating = q_heating / eff
+    final_hotwater = q_hotwater / hw_eff
+    total_kwh_per_m2 = (final_heating + final_hotwater) / gross_area
+
+    # --- CO2 ---
+    co2_total = final_heating * co2_factor + final_hotwater * co2_hw_factor
+
+    return (
+        gross_area,                    # floor_area
+        volume,                        # heated_volume
+        envelope_area,
+        l_t,                           # transmission_heat_loss
+        l_v,                           # ventilation_heat_loss
+        q_s,                           # solar_gains
+        q_i,                           # internal_gains
+        q_heating,                     # heating_demand_kwh
+        hwb,
+        final_heating,                 # final_energy_kwh
+        final_heating / gross_area,    # final_energy_kwh_per_m2
+        q_hotwater,                    # hot_water_kwh
+        total_kwh_per_m2,
+        co2_total,                     # co2_kg
+        co2_total / gross_area,        # co2_kg_per_m2
+    )
+
+
 class HWBCalculator:
     """Calculate HWB (annual heating demand) following the Excel tool logic exactly."""
 
@@ -113,6 +322,78 @@ class HWBCalculator:
 
         return result
 
+    def calculate_ber_batch(self, buildings: Sequence[BuildingInput]) -> np.ndarray:
+        """Vectorised :meth:`calculate_ber` over many buildings (no retrofit).
+
+        Inputs are stacked into NumPy arrays and the HWB balance is evaluated
+        once for all buildings with elementwise operations.
+
+        Returns:
+            Structured array (``BATCH_DTYPE``) with one row per building:
+            every ``HWBResult`` field plus ``kwh_per_m2`` (primary energy,
+            unrounded) and ``ber_band``.
+        """
+        n = len(buildings)
+        out = np.zeros(n, dtype=BATCH_DTYPE)
+        if n == 0:
+            return out
+
+        length = np.array([b.length for b in buildings], dtype=np.float64)
+        width = np.array([b.width for b in buildings], dtype=np.float64)
+        storeys = np.array([b.heated_storeys for b in buildings], dtype=np.float64)
+        storey_h = np.array([b.storey_height for b in buildings], dtype=np.float64)
+        residents = np.array([b.effective_residents for b in buildings], dtype=np.float64)
+
+        epoch = np.array([_EPOCH_IDX[b.construction_epoch] for b in buildings])
+        country = np.array([_COUNTRY_IDX[b.country] for b in buildings])
+        heating = np.array([_HEATING_IDX[b.heating_system] for b in buildings])
+        btype = np.array([_BTYPE_IDX[b.building_type] for b in buildings])
+
+        # Hot water: electric & separate uses direct-electric efficiency/CO2
+        hw_heating = np.where(
+            [b.hot_water_electric_separate for b in buildings],
+            _HEATING_IDX[HeatingSystem.ELECTRIC_DIRECT],
+            heating,
+        )
+
+        # Explicit window/door areas replace the envelope-fraction default
+        explicit = np.array(
+            [
+                (wd.north, wd.east, wd.south, wd.west, wd.doors)
+                if (wd := b.window_door_areas) is not None
+                else (0.0, 0.0, 0.0, 0.0, 0.0)
+                for b in buildings
+            ],
+            dtype=np.float64,
+        ).T.copy()
+        has_explicit = np.array([b.window_door_areas is not None for b in buildings])
+        win_frac = np.where(has_explicit, 0.0, _WIN_FRAC_TABLE[btype])
+
+        # Transposed copies so every per-column argument is a contiguous
+        # array (one kernel signature regardless of batch size)
+        u = _U_TABLE[epoch].T.copy()
+        irr = _IRR_TABLE[country].T.copy()
+        adj = _ADJ_TABLE[btype].T.copy()
+        eff = _EFF_TABLE[heating]
+        hw_eff = _EFF_TABLE[hw_heating]
+
+        results = _hwb_kernel(
+            length, width, storeys, storey_h,
+            u[0], u[1], u[2], u[3], _G_TABLE[epoch],
+            adj[0], adj[1],
+            win_frac, explicit[0], explicit[1], explicit[2], explicit[3],
+            explicit.sum(axis=0),
+            _HDD_TABLE[country], _HEATING_DAYS_TABLE[country],
+            irr[0], irr[1], irr[2], irr[3],
+            residents, eff, hw_eff, _CO2_TABLE[heating], _CO2_TABLE[hw_heating],
+        )
+        for name, values in zip(_HWB_FIELDS, results):
+            out[name] = values
+
+        out["kwh_per_m2"] = out["total_kwh_per_m2"] * _PEF_TABLE[heating]
+        out["ber_band"] = [get_ber_band(kwh)[0] for kwh in out["kwh_per_m2"]]
+        return out
+
     def calculate_with_retrofit_uvalues(
         self, building: BuildingInput, retrofit: RetrofitInput
     ) -> HWBResult:
@@ -147,235 +428,48 @@ class HWBCalculator:
         u: dict[str, float],
         g: float,
     ) -> HWBResult:
-        """Core HWB calculation with explicit U-values and g-value."""
-        b = building
+        """Core HWB calculation with explicit U-values and g-value.
 
-        # --- Geometry (Excel Calculations C2-P2) ---
-        # C2: gross storey area
-        gross_area = b.length * b.width * b.heated_storeys
-
-        # D2: net storey area = gross * 0.8
-        net_area = gross_area * NET_TO_GROSS_RATIO
-
-        # E2: envelope area (all exterior walls incl. windows)
-        #     = perimeter * storeys * storey_height
-        envelope_area = ((b.length + b.width) * 2) * b.heated_storeys * b.storey_height
-
-        # K2, L2: roof and floor = single storey footprint
-        roof_area = b.length * b.width
-        floor_area = b.length * b.width
-
-        # O2: adjacent (party) walls
-        adjacent_walls = self._adjacent_wall_area(b)
-
-        # F2: window/door total area
-        win_door_total = self._window_door_total(b, envelope_area)
-
-        # M2: total walls = envelope - windows
-        total_walls = envelope_area - win_door_total
-
-        # N2: external walls = total walls - adjacent walls
-        external_walls = total_walls - adjacent_walls
-
-        # G2-J2: window areas by orientation (equal split)
-        win_doors = self._window_door_by_orientation(b, win_door_total)
-
-        # P2: net inner volume
-        # =D2 * (storey_height - 0.35) * storeys
-        # But D2 already has storeys factored in via gross_area
-        # Actually: P2 = net_area * (storey_height - 0.35) * storeys / storeys
-        # Looking at formula: =D2*(Input!H2-0.35)*Input!G2
-        # D2 is already gross*0.8 (which includes storeys multiplication)
-        # So P2 = net_area * (storey_height - 0.35)
-        # Wait - that multiplies by storeys again. Let me re-check:
-        # C2 = E*F*G (length*width*storeys) = gross area INCLUDING storeys
-        # D2 = C2*0.8 = net area including all storeys
-        # P2 = D2 * (H2-0.35) * G2 = net_area * (height-0.35) * storeys
-        # That would double-count storeys since D2 already includes them.
-        # Actually looking more carefully: D2 = C2*0.8 where C2 = length*width*storeys
-        # So D2 = length*width*storeys*0.8 (total net floor area across all storeys)
-        # P2 = D2 * (storey_height - 0.35) * storeys
-        # This seems like it might be a volume = net_floor_area_per_storey * height * storeys
-        # Let me re-read: P2 = D2*(H2-0.35)*G2
-        # If D2 = total net area (all storeys), then this gives too much volume.
-        # More likely D2 is meant as net area per storey, and C2 is total gross.
-        # Actually C2 = E2*F2*G2 = length*width*storeys IS total gross area.
-        # So D2 = total_net_area = total_gross * 0.8
-        # And P2 = total_net_area * (storey_height - 0.35) * storeys
-        # That DOES double-count storeys.
-        # But in the Excel, this is the formula. Let me just follow it faithfully:
-        volume = net_area * (b.storey_height - FLOOR_THICKNESS) * b.heated_storeys
-
-        # --- Transmission Heat Loss (Excel AT2-AV2) ---
-        # AT2: L_e = U_win*A_win*f_win + U_roof*A_roof*f_roof + U_floor*A_floor*f_floor + U_wall*A_extwall*f_wall
-        # f_win = 1, f_roof = 1, f_floor = 0.7, f_wall = 1
-        a_win = win_door_total
-        l_e = (
-            u["FE"] * a_win * 1.0           # AH2*AI2*AJ2
-            + u["OD"] * roof_area * 1.0      # AK2*AL2*AM2
-            + u["KD"] * floor_area * FLOOR_U_FACTOR  # AN2*AO2*AP2
-            + u["AW"] * external_walls * 1.0  # AQ2*AR2*AS2
-        )
-
-        # AU2: thermal bridge supplement
-        # =MAX(0.2*(0.75-(AT2/(AI2+AL2+AO2+AR2)))*AT2, 0)
-        total_area = a_win + roof_area + floor_area + external_walls
-        if total_area > 0:
-            u_mean = l_e / total_area
-            l_psi = max(THERMAL_BRIDGE_FACTOR * (THERMAL_BRIDGE_REFERENCE - u_mean) * l_e, 0.0)
+        Resolves the enum-keyed lookups to floats and hands them to
+        :func:`_hwb_kernel`.
+        """
+        b = building
+        adj_length, adj_width = _ADJ_TABLE[_BTYPE_IDX[b.building_type]]
+
+        # Explicit window/door areas replace the envelope-fraction default
+        wd = b.window_door_areas
+        if wd is not None:
+            win_frac = 0.0
+            win = (wd.north, wd.east, wd.south, wd.west)
+            win_fixed_total = wd.north + wd.east + wd.south + wd.west + wd.doors
         else:
-            l_psi = 0.0
-
-        # AV2: total transmission coefficient
-        l_t = l_e + l_psi
+            win_frac = WINDOW_AREA_FRACTION[b.building_type]
+            win = (0.0, 0.0, 0.0, 0.0)
+            win_fixed_total = 0.0
 
-        # AW2: transmission heat loss (kWh/a)
-        hdd = HEATING_DEGREE_DAYS[b.country]
-        q_t = HDD_TO_KWH_FACTOR * l_t * hdd
-
-        # --- Ventilation Heat Loss (Excel BA2-BC2) ---
-        # BA2 = P2 (volume)
-        # BB2 = 0.34 * 0.4 * BA2
-        l_v = AIR_HEAT_CAPACITY * AIR_CHANGE_RATE * volume
-
-        # BC2 = 0.024 * BB2 * AE2
-        q_v = HDD_TO_KWH_FACTOR * l_v * hdd
-
-        # --- Internal Gains (Excel BG2) ---
-        # BG2 = 0.024 * 3.75 * D2 * AF2
-        heating_days = HEATING_DAYS[b.country]
-        q_i = HDD_TO_KWH_FACTOR * INTERNAL_GAIN_RATE * net_area * heating_days
-
-        # --- Solar Gains (Excel BU2) ---
-        # BT2 = W2 * 0.9 * 0.98  (g_effective)
-        g_eff = g * FRAME_FACTOR * DIRT_FACTOR
-
-        # BU2 = (Irr_N*A_N + Irr_E*A_E + Irr_S*A_S + Irr_W*A_W) * F_s * g_eff
-        irr = SOLAR_IRRADIANCE[b.country]
-        q_s = (
-            irr["north"] * win_doors.north
-            + irr["east"] * win_doors.east
-            + irr["south"] * win_doors.south
-            + irr["west"] * win_doors.west
-        ) * SHADING_FACTOR * g_eff
-
-        # --- Heating Demand (Excel BY2) ---
-        # BY2 = AW2 + BC2 - BG2 - BU2  (no utilisation factor!)
-        q_heating = q_t + q_v - q_i - q_s
-        # In the Excel, this can go negative (no MAX(0,...) applied)
-        # But physically it should be >= 0
-        q_heating = max(0.0, q_heating)
-
-        # BZ2: specific = Q_heating / gross_area
-        hwb = q_heating / gross_area if gross_area > 0 else 0.0
-
-        # --- Hot Water (Excel CB2) ---
-        # CB2 = Input!P2 * 40 * 365 * (4.2/3600) * 45
-        # Input!P2 = Calculations!C2/52 = gross_area / 52
-        residents = b.effective_residents
-        q_hotwater = (
-            residents
-            * HOT_WATER_LITRES_PER_PERSON_PER_DAY
-            * 365
-            * HOT_WATER_SPECIFIC_HEAT
-            * HOT_WATER_TEMP_RISE_K
+        # Hot water system: if electric & separate, use electric efficiency/CO2
+        hw_system = (
+            HeatingSystem.ELECTRIC_DIRECT if b.hot_water_electric_separate else b.heating_system
         )
+        irr = SOLAR_IRRADIANCE[b.country]
 
-        # --- Final Energy ---
-        eff = HEATING_SYSTEM_EFFICIENCY[b.heating_system]
-
-        # Hot water system: if electric & separate, use electric efficiency
-        if b.hot_water_electric_separate:
-            hw_eff = HEATING_SYSTEM_EFFICIENCY[HeatingSystem.ELECTRIC_DIRECT]
-        else:
-            hw_eff = eff
-
-        final_heating = q_heating / eff
-        final_hotwater = q_hotwater / hw_eff
-        final_total = final_heating + final_hotwater
-        total_kwh_per_m2 = final_total / gross_area if gross_area > 0 else 0.0
-
-        # --- CO2 ---
-        co2_heating = final_heating * CO2_FACTOR[b.heating_system]
-        if b.hot_water_electric_separate:
-            co2_hotwater = final_hotwater * CO2_FACTOR[HeatingSystem.ELECTRIC_DIRECT]
-        else:
-            co2_hotwater = final_hotwater * CO2_FACTOR[b.heating_system]
-        co2_total = co2_heating + co2_hotwater
-
-        return HWBResult(
-            floor_area=gross_area,
-            heated_volume=volume,
-            envelope_area=envelope_area,
-            transmission_heat_loss=l_t,
-            ventilation_heat_loss=l_v,
-            solar_gains=q_s,
-            internal_gains=q_i,
-            heating_demand_kwh=q_heating,
-            hwb=hwb,
-            final_energy_kwh=final_heating,
-            final_energy_kwh_per_m2=final_heating / gross_area if gross_area > 0 else 0.0,
-            hot_water_kwh=q_hotwater,
-            total_kwh_per_m2=total_kwh_per_m2,
-            co2_kg=co2_total,
-            co2_kg_per_m2=co2_total / gross_area if gross_area > 0 else 0.0,
+        results = _hwb_kernel(
+            float(b.length), float(b.width), float(b.heated_storeys), float(b.storey_height),
+            u["FE"], u["OD"], u["KD"], u["AW"], g,
+            float(adj_length), float(adj_width),
+            win_frac, *win, win_fixed_total,
+            HEATING_DEGREE_DAYS[b.country], HEATING_DAYS[b.country],
+            irr["north"], irr["east"], irr["south"], irr["west"],
+            float(b.effective_residents),
+            HEATING_SYSTEM_EFFICIENCY[b.heating_system],
+            HEATING_SYSTEM_EFFICIENCY[hw_system],
+            CO2_FACTOR[b.heating_system],
+            CO2_FACTOR[hw_system],
         )
+        return HWBResult(**{name: float(v) for name, v in zip(_HWB_FIELDS, results)})
 
     # --- private helpers ---
 
-    def _adjacent_wall_area(self, b: BuildingInput) -> float:
-        """Calculate party wall area (O2 in Excel).
-
-        O2 formula:
-        Semi-D (Length adj): length * storeys * storey_height
-        Semi-D (Width adj):  width * storeys * storey_height
-        Terraced (Length adj): length * storeys * storey_height * 2
-        Terraced (Width adj):  width * storeys * storey_height * 2
-        Detached: 0
-        """
-        h = b.heated_storeys * b.storey_height
-        if b.building_type == BuildingType.SEMI_D_LENGTH:
-            return b.length * h
-        elif b.building_type == BuildingType.SEMI_D_WIDTH:
-            return b.width * h
-        elif b.building_type == BuildingType.TERRACED_LENGTH:
-            return b.length * h * 2
-        elif b.building_type == BuildingType.TERRACED_WIDTH:
-            return b.width * h * 2
-        else:  # DETACHED
-            return 0.0
-
-    def _window_door_total(self, b: BuildingInput, envelope_area: float) -> float:
-        """Calculate total window/door area (F2 / Input!J2).
-
-        J2 = envelope_area * fraction (0.15/0.14/0.13 by building type)
-        """
-        if b.window_door_areas is not None:
-            wd = b.window_door_areas
-            return wd.north + wd.east + wd.south + wd.west + wd.doors
-
-        frac = WINDOW_AREA_FRACTION[b.building_type]
-        return envelope_area * frac
-
-    def _window_door_by_orientation(
-        self, b: BuildingInput, total: float
-    ) -> WindowDoorAreas:
-        """Split window area equally across 4 orientations (K2-N2).
-
-        K2 = J2 * (1/4), L2 = J2 * (1/4), M2 = J2 * (1/4), N2 = J2 * (1/4)
-        """
-        if b.window_door_areas is not None:
-            return b.window_door_areas
-
-        quarter = total / 4.0
-        return WindowDoorAreas(
-            north=quarter,
-            east=quarter,
-            south=quarter,
-            west=quarter,
-            doors=0.0,  # doors are included in the total split equally
-        )
-
     def _apply_retrofit(
         self, b: BuildingInput, r: RetrofitInput
     ) -> BuildingInput:
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
 
     # Claude Vision model
     claude_model: str = "claude-sonnet-4-5-20250929"
+    # Directory for cached Claude Vision responses (empty = caching disabled)
+    vision_cache_dir: str = ""
 
     # Default building assumptions
     default_storey_height: float = 3.0  # meters
@@ -7,11 +7,12 @@ import re
 import httpx
 
 from ber_automation.config import get_settings
+from ber_automation.geospatial.http_client import use_client
 from ber_automation.models import Coordinates
 
 
 # Irish Eircode: 3 chars (routing key) + space? + 4 chars (unique identifier)
-_EIRCODE_RE = re.compile(r"^[A-Z]\d{2}\s?[A-Z0-9]{4}$", re.IGNORECASE)
+_EIRCODE_RE = re.compile(r"^([A-Z]\d{2})\s?([A-Z0-9]{4})$")
 
 GEOCODING_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
@@ -22,18 +23,22 @@ def validate_eircode(eircode: str) -> str:
     Raises ValueError if the format is invalid.
     """
     cleaned = eircode.strip().upper().replace(" ", "")
-    # Re-format with space: ABC 1234
-    formatted = f"{cleaned[:3]} {cleaned[3:]}"
-    if not _EIRCODE_RE.match(formatted):
+    m = _EIRCODE_RE.match(cleaned)
+    if not m:
         raise ValueError(f"Invalid Eircode format: {eircode!r}")
-    return formatted
+    # Re-format with space: ABC 1234
+    return f"{m.group(1)} {m.group(2)}"
 
 
-async def geocode_eircode(eircode: str) -> Coordinates:
+async def geocode_eircode(
+    eircode: str,
+    client: httpx.AsyncClient | None = None,
+) -> Coordinates:
     """Geocode an Eircode to GPS coordinates using Google Geocoding API.
 
     Args:
         eircode: Irish Eircode (e.g. "D02 X285").
+        client: Optional shared HTTP client (a temporary one is used otherwise).
 
     Returns:
         Coordinates with lat, lng, and formatted address.
@@ -54,8 +59,8 @@ async def geocode_eircode(eircode: str) -> Coordinates:
         "key": settings.google_maps_api_key,
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(GEOCODING_URL, params=params)
+    async with use_client(client) as http:
+        resp = await http.get(GEOCODING_URL, params=params, timeout=10.0)
         resp.raise_for_status()
         data = resp.json()
 
@@ -0,0 +1,23 @@
+"""Shared-or-owned httpx client helper for the geospatial API calls."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+
+@asynccontextmanager
+async def use_client(client: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield *client* unchanged, or a temporary client closed on exit.
+
+    Lets callers pass one long-lived ``httpx.AsyncClient`` so TCP/TLS
+    connections are reused across requests, while keeping the functions
+    usable standalone.  Callers pass timeouts per request.
+    """
+    if client is not None:
+        yield client
+    else:
+        async with httpx.AsyncClient() as owned:
+            yield owned
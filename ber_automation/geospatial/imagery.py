@@ -8,6 +8,7 @@ from pathlib import Path
 import httpx
 
 from ber_automation.config import get_settings
+from ber_automation.geospatial.http_client import use_client
 from ber_automation.geospatial.scale import initial_bearing
 from ber_automation.models import Coordinates
 
@@ -21,6 +22,7 @@ async def fetch_satellite_image(
     output_path: str | Path,
     zoom: int | None = None,
     size: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> Path:
     """Download a satellite image centred on *coords* via Mapbox Static Images API.
 
@@ -29,6 +31,7 @@ async def fetch_satellite_image(
         output_path: File path to save the image.
         zoom: Map zoom level (default from settings, typically 20).
         size: Image size as "WxH" (default from settings, typically "640x640").
+        client: Optional shared HTTP client (a temporary one is used otherwise).
 
     Returns:
         Path to the saved image file.
@@ -50,8 +53,8 @@ async def fetch_satellite_image(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(url)
+    async with use_client(client) as http:
+        resp = await http.get(url, timeout=15.0)
         resp.raise_for_status()
         output_path.write_bytes(resp.content)
 
@@ -65,6 +68,7 @@ async def fetch_streetview_image(
     fov: int | None = None,
     pitch: int | None = None,
     size: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> Path | None:
     """Download a Street View image near *coords*.
 
@@ -76,6 +80,7 @@ async def fetch_streetview_image(
         fov: Field of view (default from settings).
         pitch: Camera pitch (default from settings).
         size: Image size as "WxH".
+        client: Optional shared HTTP client (a temporary one is used otherwise).
 
     Returns:
         Path to the saved image, or None if no Street View is available.
@@ -91,8 +96,8 @@ async def fetch_streetview_image(
         "location": location,
         "key": settings.google_maps_api_key,
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        meta_resp = await client.get(STREETVIEW_META_URL, params=meta_params)
+    async with use_client(client) as http:
+        meta_resp = await http.get(STREETVIEW_META_URL, params=meta_params, timeout=10.0)
         meta_resp.raise_for_status()
         meta = meta_resp.json()
 
@@ -119,8 +124,8 @@ async def fetch_streetview_image(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(STREETVIEW_URL, params=params)
+    async with use_client(client) as http:
+        resp = await http.get(STREETVIEW_URL, params=params, timeout=15.0)
         resp.raise_for_status()
         output_path.write_bytes(resp.content)
 
@@ -133,6 +138,7 @@ async def fetch_streetview_images(
     fov: int | None = None,
     pitch: int | None = None,
     size: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[Path]:
     """Download Street View images at 4 headings (every 90 degrees) around *coords*.
 
@@ -145,6 +151,7 @@ async def fetch_streetview_images(
         fov: Field of view (default from settings).
         pitch: Camera pitch (default from settings).
         size: Image size as "WxH".
+        client: Optional shared HTTP client (a temporary one is used otherwise).
 
     Returns:
         List of Paths to saved images (may be fewer than 4 if Street View
@@ -161,8 +168,8 @@ async def fetch_streetview_images(
         "location": location,
         "key": settings.google_maps_api_key,
     }
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        meta_resp = await client.get(STREETVIEW_META_URL, params=meta_params)
+    async with use_client(client) as http:
+        meta_resp = await http.get(STREETVIEW_META_URL, params=meta_params, timeout=10.0)
         meta_resp.raise_for_status()
         meta = meta_resp.json()
 
@@ -191,8 +198,8 @@ async def fetch_streetview_images(
             "key": settings.google_maps_api_key,
         }
         out = output_dir / f"streetview_{index}.jpg"
-        async with httpx.AsyncClient(timeout=15.0) as c:
-            resp = await c.get(STREETVIEW_URL, params=params)
+        async with use_client(client) as http:
+            resp = await http.get(STREETVIEW_URL, params=params, timeout=15.0)
             resp.raise_for_status()
             out.write_bytes(resp.content)
         return out
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # --- Enums ---
@@ -121,12 +121,19 @@ class RetrofitInput(BaseModel):
 
 
 class FootprintResult(BaseModel):
-    """Result from building footprint extraction."""
+    """Result from building footprint extraction.
+
+    Frozen: adjusted footprints are always built as new instances, so one
+    instance can be shared safely.
+    """
+    model_config = ConfigDict(frozen=True, ser_json_bytes="base64", val_json_bytes="base64")
+
     length_m: float
     width_m: float
     area_m2: float
     confidence: float = Field(ge=0, le=1)
-    contour_points: list[list[int]] = Field(default_factory=list)
+    # Legacy [[x, y], ...] list, or packed int16 (x, y) pairs as bytes
+    contour_points: Optional[Union[list[list[int]], bytes]] = None
     source: str = "opencv"  # "opencv", "claude_vision", "fallback"
     building_shape: str = "rectangular"
 
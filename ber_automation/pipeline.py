@@ -10,6 +10,8 @@ import asyncio
 import tempfile
 from pathlib import Path
 
+import httpx
+
 from ber_automation.ber_engine.calculator import HWBCalculator
 from ber_automation.geospatial.geocoder import geocode_eircode
 from ber_automation.geospatial.imagery import (
@@ -26,7 +28,12 @@ from ber_automation.models import (
     RetrofitInput,
     StreetViewAnalysis,
 )
-from ber_automation.vision.claude_analyzer import analyze_satellite, analyze_streetview
+from ber_automation.vision.claude_analyzer import (
+    analyze_satellite,
+    analyze_streetview,
+    opencv_footprint_is_sufficient,
+    record_opencv_shortcut,
+)
 from ber_automation.vision.footprint import extract_footprint
 
 
@@ -43,6 +50,7 @@ class BERPipeline:
         eircode: str,
         retrofit: RetrofitInput | None = None,
         overrides: dict | None = None,
+        session: httpx.AsyncClient | None = None,
     ) -> PipelineResult:
         """Run the full pipeline for an Eircode.
 
@@ -51,6 +59,8 @@ class BERPipeline:
             retrofit: Optional retrofit parameters for comparison.
             overrides: Optional dict of BuildingInput field overrides
                        (e.g. {"heating_system": "gas_boiler"}).
+            session: Optional shared HTTP client reused for geocoding and
+                     imagery requests (keeps connections warm).
 
         Returns:
             PipelineResult with all intermediate and final results.
@@ -59,7 +69,7 @@ class BERPipeline:
 
         # Phase 1: Geocode
         try:
-            coords = await geocode_eircode(eircode)
+            coords = await geocode_eircode(eircode, client=session)
             result.coordinates = coords
         except Exception as e:
             result.errors.append(f"Geocoding failed: {e}")
@@ -69,8 +79,8 @@ class BERPipeline:
         sat_path = self.output_dir / "satellite.jpg"
         sv_dir = self.output_dir / "streetview"
 
-        sat_task = fetch_satellite_image(coords, sat_path)
-        sv_task = fetch_streetview_images(coords, sv_dir)
+        sat_task = fetch_satellite_image(coords, sat_path, client=session)
+        sv_task = fetch_streetview_images(coords, sv_dir, client=session)
 
         sv_paths: list[Path] = []
         try:
@@ -102,7 +112,8 @@ class BERPipeline:
             except Exception as e:
                 result.errors.append(f"Claude analysis failed: {e}")
 
-        # Phase 4: Footprint extraction (Claude Vision primary, OpenCV fallback)
+        # Phase 4: Footprint extraction (Claude Vision primary, OpenCV fallback;
+        # a confident OpenCV result skips the Claude call entirely)
         if result.satellite_image_path:
             claude_fp = None
             opencv_fp = None
@@ -115,18 +126,7 @@ class BERPipeline:
                 sat_kwargs["adjacent_side"] = sa.adjacent_side
                 sat_kwargs["estimated_units_in_row"] = sa.estimated_units_in_row
 
-            # Primary: Claude Vision satellite analysis
-            try:
-                claude_fp = await analyze_satellite(
-                    result.satellite_image_path,
-                    lat=coords.lat,
-                    zoom=20,
-                    **sat_kwargs,
-                )
-            except Exception as e:
-                result.errors.append(f"Claude satellite analysis failed: {e}")
-
-            # Secondary: OpenCV for cross-validation
+            # Local OpenCV first: free, and used for cross-validation
             try:
                 opencv_fp = extract_footprint(
                     result.satellite_image_path,
@@ -136,6 +136,21 @@ class BERPipeline:
             except Exception as e:
                 result.errors.append(f"OpenCV footprint extraction failed: {e}")
 
+            shortcut = opencv_fp is not None and opencv_footprint_is_sufficient(opencv_fp)
+            record_opencv_shortcut(shortcut)
+
+            # Claude Vision satellite analysis unless OpenCV is already confident
+            if not shortcut:
+                try:
+                    claude_fp = await analyze_satellite(
+                        result.satellite_image_path,
+                        lat=coords.lat,
+                        zoom=20,
+                        **sat_kwargs,
+                    )
+                except Exception as e:
+                    result.errors.append(f"Claude satellite analysis failed: {e}")
+
             # Reconcile results
             footprint = self._reconcile_footprints(claude_fp, opencv_fp)
 
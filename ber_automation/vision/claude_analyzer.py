@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import io
 import json
+import logging
+import random
+import re
+from functools import lru_cache
 from pathlib import Path
 
-import anthropic
+from PIL import Image, ImageDraw
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 from ber_automation.config import get_settings
 from ber_automation.geospatial.scale import meters_per_pixel
@@ -17,6 +28,86 @@ from ber_automation.models import (
     HeatingSystem,
     StreetViewAnalysis,
 )
+from ber_automation.vision.vision_cache import cache_key, get_vision_cache
+
+logger = logging.getLogger(__name__)
+
+# The anthropic SDK takes a noticeable fraction of a second to import, so it
+# is loaded on the first API call rather than with this module; see
+# _get_anthropic().  Tests replace this global with a fake.
+anthropic = None
+
+# Bump whenever prompts or response parsing change so cached results are invalidated
+PROMPT_VERSION = "2"
+# Retry policy for transient Anthropic API failures
+_RETRY_BASE_DELAY = 1.0  # seconds
+_RETRY_MAX_DELAY = 60.0  # seconds
+# Backoff sleep used by _call_with_retry; tests replace this rather than
+# the process-wide asyncio.sleep
+_sleep = asyncio.sleep
+
+
+def _get_anthropic():
+    """Return the ``anthropic`` module, importing it on first use."""
+    global anthropic
+    if anthropic is None:
+        import anthropic as _anthropic
+
+        anthropic = _anthropic
+    return anthropic
+
+
+async def _call_with_retry(coro_factory, max_attempts: int = 5):
+    """Await ``coro_factory()``, retrying rate limits and transient errors.
+
+    Retries ``RateLimitError`` (honouring its ``retry-after`` header),
+    ``APIConnectionError`` and 5xx ``APIStatusError`` with exponential
+    backoff plus jitter.  Other errors, and the final failed attempt, are
+    re-raised.
+    """
+    api = _get_anthropic()
+    for attempt in range(max_attempts):
+        delay = None
+        try:
+            return await coro_factory()
+        except api.RateLimitError as err:
+            if attempt == max_attempts - 1:
+                raise
+            retry_after = err.response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    delay = min(_RETRY_MAX_DELAY, float(retry_after))
+                except ValueError:
+                    delay = None
+        except (api.APIConnectionError, api.APIStatusError) as err:
+            if isinstance(err, api.APIStatusError) and err.status_code < 500:
+                raise
+            if attempt == max_attempts - 1:
+                raise
+
+        if delay is None:
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+            delay += random.uniform(0, 0.5)
+        await _sleep(delay)
+
+
+# Outermost {...} span — tolerates code fences and prose around the JSON
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _parse_json_response(response_text: str) -> dict:
+    """Extract and parse the JSON object from a Claude response.
+
+    Raises json.JSONDecodeError (orjson's error subclasses it) when no
+    valid JSON object can be found.
+    """
+    m = _JSON_RE.search(response_text)
+    payload = m.group(0) if m else response_text
+    data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("Expected a JSON object", payload, 0)
+    return data
+
 
 _ANALYSIS_BODY = """
 {
@@ -91,9 +182,81 @@ ANALYSIS_PROMPT = (
     + _ANALYSIS_BODY
 )
 
+_MOSAIC_PROMPT_HEADER = (
+    "You are an expert building surveyor analysing an Irish residential building "
+    "from Google Street View images taken at different angles (approximately 90 "
+    "degrees apart) around the same location.\n\n"
+    "The images are combined into a single {grid} image showing {layout}; each "
+    "tile is labelled with its view.\n\n"
+    "Cross-reference all views to build a complete picture of the building. "
+    "Look for details that may only be visible from certain angles (e.g. an oil "
+    "tank at the side, a heat pump at the rear, a shared wall only visible from "
+    "the side).\n\n"
+    "Analyse this image and return a JSON object with the following fields:"
+)
+_GRID_POSITIONS = ("top-left", "top-right", "bottom-left", "bottom-right")
+
+
+def _mosaic_prompt(labels: list[str]) -> str:
+    """Mosaic prompt describing only the views actually in the grid."""
+    grid = "2x2 grid" if len(labels) > 2 else "side-by-side"
+    positions = ("left", "right") if len(labels) == 2 else _GRID_POSITIONS
+    layout = ", ".join(f"the {label} view ({pos})" for label, pos in zip(labels, positions))
+    return _MOSAIC_PROMPT_HEADER.format(grid=grid, layout=layout) + _ANALYSIS_BODY
+
+
+_MEDIA_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+
+
+def _encode_image(path: Path) -> tuple[str, str]:
+    """Read an image file and return ``(media_type, base64_data)`` for Claude."""
+    data = base64.standard_b64encode(path.read_bytes()).decode("utf-8")
+    return _MEDIA_TYPES.get(path.suffix.lower(), "image/jpeg"), data
+
+
+# 2x2 grid of 768px tiles keeps the mosaic near Claude's ~1568px sweet spot
+_MOSAIC_TILE = 768
+_MOSAIC_LABELS = ("front", "right", "back", "left")
+# fetch_streetview_images names files streetview_<heading index>.jpg; the
+# index (not the list position) identifies the view when a fetch failed
+_VIEW_INDEX_RE = re.compile(r"_([0-3])$")
+
+
+def _mosaic_labels(paths: list[Path]) -> list[str]:
+    """View label for each path, from its heading index or else its position."""
+    labels = []
+    for pos, path in enumerate(paths):
+        m = _VIEW_INDEX_RE.search(path.stem)
+        labels.append(_MOSAIC_LABELS[int(m.group(1)) if m else pos])
+    return labels
+
+
+def _mosaic(paths: list[Path], labels: list[str]) -> bytes:
+    """Stitch 2-4 Street View images into one labelled grid JPEG (2 per row).
+
+    Blocking Pillow work; call it via ``asyncio.to_thread`` from coroutines.
+    """
+    rows = (len(paths) + 1) // 2
+    canvas = Image.new("RGB", (2 * _MOSAIC_TILE, rows * _MOSAIC_TILE))
+    draw = ImageDraw.Draw(canvas)
+
+    for idx, (path, label) in enumerate(zip(paths, labels, strict=True)):
+        x = (idx % 2) * _MOSAIC_TILE
+        y = (idx // 2) * _MOSAIC_TILE
+        with Image.open(path) as img:
+            tile = img.convert("RGB")
+            tile.thumbnail((_MOSAIC_TILE, _MOSAIC_TILE))
+            canvas.paste(tile, (x, y))
+        draw.text((x + 10, y + 10), label, fill="white", stroke_width=2, stroke_fill="black")
+
+    buf = io.BytesIO()
+    canvas.save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
 
 async def analyze_streetview(
     image_paths: str | Path | list[str | Path],
+    mosaic: bool = False,
 ) -> StreetViewAnalysis:
     """Send Street View image(s) to Claude Vision for building analysis.
 
@@ -103,6 +266,11 @@ async def analyze_streetview(
 
     Args:
         image_paths: Path (or list of paths) to Street View image file(s).
+        mosaic: Combine 2-4 images into a single labelled grid image,
+            cutting image tokens roughly by the number of views.  Views are
+            labelled front / right / back / left from the heading index in
+            ``streetview_<i>.jpg`` names (list order otherwise).  Any other
+            count falls back to separate image blocks.
 
     Returns:
         StreetViewAnalysis with building classification and confidence.
@@ -116,48 +284,69 @@ async def analyze_streetview(
         image_paths = [image_paths]
     image_paths = [Path(p) for p in image_paths]
 
-    media_types_map = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
-
-    # Build content blocks: one image block per file, then the text prompt
+    # Build content blocks: one image block per file (or a single mosaic),
+    # then the text prompt
     content: list[dict] = []
-    for idx, img_path in enumerate(image_paths):
-        image_data = base64.standard_b64encode(img_path.read_bytes()).decode("utf-8")
-        suffix = img_path.suffix.lower()
-        media_type = media_types_map.get(suffix, "image/jpeg")
+    image_data_list: list[str] = []
+    if mosaic and 2 <= len(image_paths) <= len(_MOSAIC_LABELS):
+        labels = _mosaic_labels(image_paths)
+        # Pillow decoding/encoding is blocking; keep it off the event loop
+        mosaic_jpeg = await asyncio.to_thread(_mosaic, image_paths, labels)
+        image_data = base64.standard_b64encode(mosaic_jpeg).decode("utf-8")
+        image_data_list.append(image_data)
         content.append({
             "type": "image",
             "source": {
                 "type": "base64",
-                "media_type": media_type,
+                "media_type": "image/jpeg",
                 "data": image_data,
             },
         })
-
-    # Choose prompt based on single vs multi-image
-    prompt_text = ANALYSIS_PROMPT if len(image_paths) > 1 else ANALYSIS_PROMPT_SINGLE
+        prompt_text = _mosaic_prompt(labels)
+    else:
+        for img_path in image_paths:
+            media_type, image_data = _encode_image(img_path)
+            image_data_list.append(image_data)
+            content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": image_data,
+                },
+            })
+
+        # Choose prompt based on single vs multi-image
+        prompt_text = ANALYSIS_PROMPT if len(image_paths) > 1 else ANALYSIS_PROMPT_SINGLE
     content.append({"type": "text", "text": prompt_text})
 
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    cache = get_vision_cache(settings.vision_cache_dir) if settings.vision_cache_dir else None
+    if cache is not None:
+        key = cache_key(
+            (d.encode("ascii") for d in image_data_list),
+            prompt_text, settings.claude_model, PROMPT_VERSION,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return StreetViewAnalysis.model_validate_json(cached)
 
-    message = await client.messages.create(
+    # _call_with_retry owns the retry policy; SDK retries would stack on top
+    client = _get_anthropic().AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
+
+    message = await _call_with_retry(lambda: client.messages.create(
         model=settings.claude_model,
         max_tokens=1024,
         messages=[{"role": "user", "content": content}],
-    )
+    ))
 
     # Parse response
-    response_text = message.content[0].text.strip()
-
-    # Handle potential markdown code blocks
-    if response_text.startswith("```"):
-        lines = response_text.split("\n")
-        response_text = "\n".join(lines[1:-1])
+    response_text = message.content[0].text
 
     try:
-        data = json.loads(response_text)
+        data = _parse_json_response(response_text)
     except json.JSONDecodeError:
         return StreetViewAnalysis(
-            reasoning=f"Failed to parse Claude response: {response_text[:200]}"
+            reasoning=f"Failed to parse Claude response: {response_text.strip()[:200]}"
         )
 
     # Map to enums with defaults
@@ -182,7 +371,7 @@ async def analyze_streetview(
     except (TypeError, ValueError):
         units_in_row = 1
 
-    return StreetViewAnalysis(
+    analysis = StreetViewAnalysis(
         construction_epoch=epoch,
         building_type=btype,
         estimated_storeys=data.get("estimated_storeys", 2),
@@ -192,6 +381,9 @@ async def analyze_streetview(
         confidence=data.get("confidence", 0.5),
         reasoning=data.get("reasoning", ""),
     )
+    if cache is not None:
+        cache.set(key, analysis.model_dump_json())
+    return analysis
 
 
 SATELLITE_ANALYSIS_PROMPT = """You are an expert building surveyor analysing a Google Maps satellite image of an Irish residential property.
@@ -226,6 +418,22 @@ Return ONLY a JSON object:
 }}"""
 
 
+@lru_cache(maxsize=1024)
+def _satellite_prompt(lat_bucket: int, zoom: int) -> tuple[float, str]:
+    """Return (meters per pixel, formatted base prompt) for a latitude bucket.
+
+    *lat_bucket* is the latitude in hundredths of a degree.
+    """
+    mpp = meters_per_pixel(lat_bucket / 100, zoom)
+    # Assume 640x640 default image size
+    ground_w = 640 * mpp
+    ground_h = 640 * mpp
+    prompt = SATELLITE_ANALYSIS_PROMPT.format(
+        mpp=mpp, ground_w=ground_w, ground_h=ground_h,
+    )
+    return mpp, prompt
+
+
 async def analyze_satellite(
     image_path: str | Path,
     lat: float,
@@ -251,22 +459,10 @@ async def analyze_satellite(
     if not settings.anthropic_api_key:
         raise ValueError("ANTHROPIC_API_KEY not configured")
 
-    image_path = Path(image_path)
-    image_data = base64.standard_b64encode(image_path.read_bytes()).decode("utf-8")
-
-    suffix = image_path.suffix.lower()
-    media_types = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
-    media_type = media_types.get(suffix, "image/jpeg")
-
-    # Compute scale for the prompt
-    mpp = meters_per_pixel(lat, zoom)
-    # Assume 640x640 default image size
-    ground_w = 640 * mpp
-    ground_h = 640 * mpp
+    media_type, image_data = _encode_image(Path(image_path))
 
-    prompt = SATELLITE_ANALYSIS_PROMPT.format(
-        mpp=mpp, ground_w=ground_w, ground_h=ground_h,
-    )
+    # Scale is effectively constant within a 0.01 degree latitude bucket
+    _, prompt = _satellite_prompt(int(round(lat * 100)), zoom)
 
     # Inject building-type context from street view when available
     if building_type and building_type.startswith(("terraced", "semi_d")):
@@ -280,9 +476,17 @@ async def analyze_satellite(
             f"- Divide the repeating dimension by {units} if you see the full row"
         )
 
-    client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+    cache = get_vision_cache(settings.vision_cache_dir) if settings.vision_cache_dir else None
+    if cache is not None:
+        key = cache_key([image_data.encode("ascii")], prompt, settings.claude_model, PROMPT_VERSION)
+        cached = cache.get(key)
+        if cached is not None:
+            return FootprintResult.model_validate_json(cached)
+
+    # _call_with_retry owns the retry policy; SDK retries would stack on top
+    client = _get_anthropic().AsyncAnthropic(api_key=settings.anthropic_api_key, max_retries=0)
 
-    message = await client.messages.create(
+    message = await _call_with_retry(lambda: client.messages.create(
         model=settings.claude_model,
         max_tokens=1024,
         messages=[
@@ -304,17 +508,12 @@ async def analyze_satellite(
                 ],
             }
         ],
-    )
-
-    response_text = message.content[0].text.strip()
+    ))
 
-    # Handle potential markdown code blocks
-    if response_text.startswith("```"):
-        lines = response_text.split("\n")
-        response_text = "\n".join(lines[1:-1])
+    response_text = message.content[0].text
 
     try:
-        data = json.loads(response_text)
+        data = _parse_json_response(response_text)
     except json.JSONDecodeError:
         return FootprintResult(
             length_m=0, width_m=0, area_m2=0, confidence=0,
@@ -340,7 +539,7 @@ async def analyze_satellite(
     if area < 20 or area > 500:
         confidence = min(confidence, 0.15)
 
-    return FootprintResult(
+    footprint = FootprintResult(
         length_m=round(length, 1),
         width_m=round(width, 1),
         area_m2=round(area, 1),
@@ -348,3 +547,33 @@ async def analyze_satellite(
         source="claude_vision",
         building_shape=building_shape,
     )
+    if cache is not None:
+        cache.set(key, footprint.model_dump_json())
+    return footprint
+
+
+# OpenCV results at least this confident (and plausibly sized) skip Claude
+OPENCV_SHORTCUT_CONFIDENCE = 0.7
+_shortcut_stats = {"hits": 0, "calls": 0}
+
+
+def opencv_footprint_is_sufficient(footprint: FootprintResult) -> bool:
+    """True when an OpenCV footprint is good enough to skip Claude Vision."""
+    return (
+        footprint.confidence >= OPENCV_SHORTCUT_CONFIDENCE
+        and 20 <= footprint.area_m2 <= 500
+    )
+
+
+def record_opencv_shortcut(hit: bool) -> None:
+    """Count and log how often the OpenCV fast-path avoids a Claude call."""
+    _shortcut_stats["calls"] += 1
+    if hit:
+        _shortcut_stats["hits"] += 1
+    logger.info(
+        "OpenCV shortcut %s (hit rate %d/%d)",
+        "hit" if hit else "miss",
+        _shortcut_stats["hits"],
+        _shortcut_stats["calls"],
+    )
+
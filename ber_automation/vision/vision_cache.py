@@ -0,0 +1,76 @@
+"""Content-addressed on-disk cache for Claude Vision responses.
+
+Vision calls are deterministic per (images, prompt, model), so repeated
+analyses of the same property — re-runs, retries, dev iterations — can be
+served from disk instead of the API.  Entries are stored in a small SQLite
+database as the JSON dump of the resulting Pydantic model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+
+def cache_key(
+    images: Iterable[bytes],
+    prompt: str,
+    model: str,
+    version: str,
+) -> str:
+    """Hash image bytes, prompt text, model name and prompt version into a key."""
+    h = hashlib.blake2b(digest_size=16)
+    for data in images:
+        h.update(data)
+    h.update(prompt.encode("utf-8"))
+    h.update(model.encode("utf-8"))
+    h.update(version.encode("utf-8"))
+    return h.hexdigest()
+
+
+class VisionCache:
+    """Minimal key/value store backed by SQLite.
+
+    One instance is shared process-wide (see :func:`get_vision_cache`) and
+    Streamlit runs each rerun on a new thread, so the connection is opened
+    with ``check_same_thread=False`` and every access holds a lock.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            cache_dir / "vision_cache.sqlite3", check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for *key*, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store *value* under *key*, replacing any existing entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._conn.commit()
+
+
+@lru_cache(maxsize=None)
+def get_vision_cache(cache_dir: str) -> VisionCache:
+    """Get the cache for *cache_dir* (one connection per directory)."""
+    return VisionCache(cache_dir)
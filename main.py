@@ -3,22 +3,16 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ber_automation.ber_engine.calculator import HWBCalculator
-from ber_automation.models import (
-    BERResult,
-    BuildingInput,
-    BuildingType,
-    ConstructionEpoch,
-    Country,
-    HeatingSystem,
-    RetrofitInput,
-)
-from ber_automation.pipeline import BERPipeline
+# The calculator, pipeline and models (which pull in pydantic, httpx, OpenCV,
+# anthropic, ...) are imported inside the subcommand that uses them to keep
+# start-up fast.
+if TYPE_CHECKING:
+    from ber_automation.models import BERResult
 
 
 def main():
@@ -27,58 +21,98 @@ def main():
     )
     sub = parser.add_subparsers(dest="command")
 
-    # --- pipeline command ---
+    # All subcommands are registered so they show up in --help, but only the
+    # one being invoked gets its arguments built.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
     pipe_p = sub.add_parser("pipeline", help="Run full pipeline from Eircode")
+    man_p = sub.add_parser("manual", help="Calculate BER from manual inputs")
+    sub.add_parser("app", help="Launch Streamlit web app")
+    if command == "pipeline":
+        _add_pipeline(pipe_p)
+    elif command == "manual":
+        _add_manual(man_p)
+
+    args = parser.parse_args()
+
+    if args.command == "pipeline":
+        _run_pipeline(args)
+    elif args.command == "manual":
+        _run_manual(args)
+    elif args.command == "app":
+        _run_app()
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+def _add_pipeline(pipe_p: argparse.ArgumentParser):
     pipe_p.add_argument("eircode", help="Irish Eircode (e.g. D02X285)")
     pipe_p.add_argument("--output-dir", default="output", help="Output directory")
 
-    # --- manual command ---
-    man_p = sub.add_parser("manual", help="Calculate BER from manual inputs")
+
+@lru_cache(maxsize=None)
+def _choices(enum_cls) -> tuple[str, ...]:
+    """Valid CLI values for *enum_cls*, built once from its value map."""
+    return tuple(enum_cls._value2member_map_)
+
+
+def _add_manual(man_p: argparse.ArgumentParser):
+    from ber_automation.models import (
+        BuildingType,
+        ConstructionEpoch,
+        Country,
+        HeatingSystem,
+    )
+
     man_p.add_argument("--length", type=float, required=True, help="Building length (m)")
     man_p.add_argument("--width", type=float, required=True, help="Building width (m)")
     man_p.add_argument("--storeys", type=int, default=2, help="Heated storeys")
     man_p.add_argument("--storey-height", type=float, default=3.0, help="Storey height (m)")
     man_p.add_argument(
         "--type",
-        choices=[bt.value for bt in BuildingType],
+        choices=_choices(BuildingType),
         default="detached",
     )
     man_p.add_argument(
         "--epoch",
-        choices=[e.value for e in ConstructionEpoch],
+        choices=_choices(ConstructionEpoch),
         default="before_1980",
     )
     man_p.add_argument(
         "--country",
-        choices=[c.value for c in Country],
+        choices=_choices(Country),
         default="ireland",
     )
     man_p.add_argument(
         "--heating",
-        choices=[h.value for h in HeatingSystem],
+        choices=_choices(HeatingSystem),
         default="gas_boiler",
     )
     man_p.add_argument("--hw-electric", action="store_true", help="Hot water electric & separate")
 
-    # --- streamlit command ---
-    sub.add_parser("app", help="Launch Streamlit web app")
 
-    args = parser.parse_args()
+def _run_pipeline(args):
+    import asyncio
 
-    if args.command == "pipeline":
-        _run_pipeline(args)
-    elif args.command == "manual":
-        _run_manual(args)
-    elif args.command == "app":
-        _run_app()
-    else:
-        parser.print_help()
-        sys.exit(1)
+    import httpx
 
+    from ber_automation.pipeline import BERPipeline
+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
-def _run_pipeline(args):
     pipeline = BERPipeline(output_dir=args.output_dir)
-    result = asyncio.run(pipeline.run(args.eircode))
+
+    async def _go():
+        # One client for the whole run: connections are reused across requests
+        async with httpx.AsyncClient() as session:
+            return await pipeline.run(args.eircode, session=session)
+
+    result = asyncio.run(_go())
 
     if result.errors:
         print("Warnings:")
@@ -93,15 +127,26 @@ def _run_pipeline(args):
 
 
 def _run_manual(args):
+    from ber_automation.ber_engine.calculator import HWBCalculator
+    from ber_automation.models import (
+        BuildingInput,
+        BuildingType,
+        ConstructionEpoch,
+        Country,
+        HeatingSystem,
+    )
+
     building = BuildingInput(
         length=args.length,
         width=args.width,
         heated_storeys=args.storeys,
         storey_height=args.storey_height,
-        building_type=BuildingType(args.type),
-        construction_epoch=ConstructionEpoch(args.epoch),
-        country=Country(args.country),
-        heating_system=HeatingSystem(args.heating),
+        # argparse already restricted these to valid values: index the
+        # value -> member maps directly instead of calling the Enum constructors
+        building_type=BuildingType._value2member_map_[args.type],
+        construction_epoch=ConstructionEpoch._value2member_map_[args.epoch],
+        country=Country._value2member_map_[args.country],
+        heating_system=HeatingSystem._value2member_map_[args.heating],
         hot_water_electric_separate=args.hw_electric,
     )
 
@@ -111,24 +156,30 @@ def _run_manual(args):
 
 
 def _run_app():
-    import subprocess
+    # Run streamlit in this interpreter rather than spawning its console script
+    from streamlit.web import cli as stcli
+
     app_path = Path(__file__).parent / "app" / "streamlit_app.py"
-    subprocess.run(["streamlit", "run", str(app_path)], check=True)
+    sys.argv = ["streamlit", "run", str(app_path)]
+    sys.exit(stcli.main())
 
 
 def _print_ber(ber: BERResult):
     hw = ber.hwb_result
-    print(f"\n{'='*50}")
-    print(f"  BER Rating: {ber.ber_band}")
-    print(f"  Energy: {ber.kwh_per_m2:.0f} kWh/m2/yr (primary)")
-    print(f"{'='*50}")
-    print(f"  Floor area:        {hw.floor_area:.0f} m2")
-    print(f"  Heated volume:     {hw.heated_volume:.0f} m3")
-    print(f"  HWB:               {hw.hwb:.1f} kWh/m2/yr")
-    print(f"  Final energy:      {hw.final_energy_kwh_per_m2:.1f} kWh/m2/yr")
-    print(f"  Hot water:         {hw.hot_water_kwh:.0f} kWh/yr")
-    print(f"  CO2:               {hw.co2_kg_per_m2:.1f} kg/m2/yr")
-    print(f"{'='*50}\n")
+    rule = "=" * 50
+    sys.stdout.write(
+        f"\n{rule}\n"
+        f"  BER Rating: {ber.ber_band}\n"
+        f"  Energy: {ber.kwh_per_m2:.0f} kWh/m2/yr (primary)\n"
+        f"{rule}\n"
+        f"  Floor area:        {hw.floor_area:.0f} m2\n"
+        f"  Heated volume:     {hw.heated_volume:.0f} m3\n"
+        f"  HWB:               {hw.hwb:.1f} kWh/m2/yr\n"
+        f"  Final energy:      {hw.final_energy_kwh_per_m2:.1f} kWh/m2/yr\n"
+        f"  Hot water:         {hw.hot_water_kwh:.0f} kWh/yr\n"
+        f"  CO2:               {hw.co2_kg_per_m2:.1f} kg/m2/yr\n"
+        f"{rule}\n\n"
+    )
 
 
 if __name__ == "__main__":
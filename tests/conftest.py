@@ -2,18 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from ber_automation.ber_engine.calculator import HWBCalculator
 from ber_automation.models import (
     BuildingInput,
     BuildingType,
     ConstructionEpoch,
     Country,
     HeatingSystem,
+    HWBResult,
 )
 
 
-@pytest.fixture
+def pytest_sessionstart(session):
+    """Compile the numba HWB kernel before any test runs.
+
+    Both the scalar (``calculate``) and array (``calculate_ber_batch``)
+    signatures are warmed, so no single test absorbs the JIT cost.  With
+    ``cache=True`` later sessions load the compiled kernel from disk.
+    """
+    building = BuildingInput(
+        length=1.0,
+        width=1.0,
+        heated_storeys=1,
+        storey_height=2.5,
+        building_type=BuildingType.DETACHED,
+        construction_epoch=ConstructionEpoch.BEFORE_1980,
+        country=Country.IRELAND,
+        heating_system=HeatingSystem.GAS_BOILER,
+    )
+    calculator = HWBCalculator()
+    calculator.calculate(building)
+    calculator.calculate_ber_batch([building])
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop when it is installed, like main.py does."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def calc() -> HWBCalculator:
+    """One calculator shared by the whole test session (it holds no state)."""
+    return HWBCalculator()
+
+
+@pytest.fixture(scope="session")
 def typical_irish_house() -> BuildingInput:
     """A typical pre-1980 Irish detached house."""
     return BuildingInput(
@@ -28,7 +74,7 @@ def typical_irish_house() -> BuildingInput:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def modern_semi_d() -> BuildingInput:
     """A modern (post-2010) semi-detached house."""
     return BuildingInput(
@@ -41,3 +87,75 @@ def modern_semi_d() -> BuildingInput:
         country=Country.IRELAND,
         heating_system=HeatingSystem.HEAT_PUMP_AIR,
     )
+
+
+# Calculated once per session and shared by every test that only reads them.
+
+@pytest.fixture(scope="session")
+def typical_irish_house_hwb(calc, typical_irish_house) -> HWBResult:
+    """HWB result for ``typical_irish_house``."""
+    return calc.calculate(typical_irish_house)
+
+
+@pytest.fixture(scope="session")
+def modern_semi_d_hwb(calc, modern_semi_d) -> HWBResult:
+    """HWB result for ``modern_semi_d``."""
+    return calc.calculate(modern_semi_d)
+
+
+@pytest.fixture(scope="module")
+def anthropic_factory():
+    """Fake settings + AsyncAnthropic for claude_analyzer, built once per module.
+
+    Returns a callable that sets the text the mocked client answers with,
+    clears the recorded calls and returns them as a list of the keyword
+    arguments passed to ``messages.create`` (one dict per call).
+    The patched objects are exposed as its ``settings`` and ``anthropic``
+    attributes; ``client_kwargs`` records the keyword arguments of each
+    ``AsyncAnthropic(...)`` construction.
+    """
+    # Imported here, not at module top, so sessions that never touch the
+    # vision code do not pay for loading the SDK
+    import anthropic
+
+    # Only the attributes claude_analyzer reads are provided, as plain
+    # namespaces rather than MagicMocks
+    mock_response = SimpleNamespace(content=[SimpleNamespace(text="")])
+
+    mock_settings = SimpleNamespace(
+        anthropic_api_key="test-key",
+        claude_model="test-model",
+        vision_cache_dir="",
+    )
+
+    captured: list[dict] = []
+
+    async def _create(**kwargs):
+        captured.append(kwargs)
+        return mock_response
+
+    mock_client = SimpleNamespace(messages=SimpleNamespace(create=_create))
+    client_kwargs: list[dict] = []
+
+    def _make_client(**kwargs):
+        client_kwargs.append(kwargs)
+        return mock_client
+
+    # Keep the real exception types so _call_with_retry can still catch them
+    mock_anthropic = SimpleNamespace(
+        AsyncAnthropic=_make_client,
+        APIConnectionError=anthropic.APIConnectionError,
+        APIStatusError=anthropic.APIStatusError,
+        RateLimitError=anthropic.RateLimitError,
+    )
+
+    def _set(response_text: str):
+        mock_response.content[0].text = response_text
+        captured.clear()
+        client_kwargs.clear()
+        return captured
+
+    _set.settings = mock_settings
+    _set.anthropic = mock_anthropic
+    _set.client_kwargs = client_kwargs
+    return _set
@@ -0,0 +1,391 @@
+"""Tests for Claude Vision satellite/Street View analysis (async, mocked API).
+
+The pure, mock-free pipeline helpers are tested in
+``test_satellite_analysis_pure.py``.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from unittest.mock import AsyncMock
+
+import anthropic
+import httpx
+import pytest
+from PIL import Image
+
+from ber_automation.models import BuildingType
+from ber_automation.vision import claude_analyzer
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_claude(anthropic_factory):
+    """Point claude_analyzer at the mocked settings, Anthropic module and encoder.
+
+    Installed once for the whole module rather than per test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(claude_analyzer, "get_settings", lambda: anthropic_factory.settings)
+        mp.setattr(claude_analyzer, "anthropic", anthropic_factory.anthropic)
+        # Image contents are never inspected, so skip reading/encoding files
+        mp.setattr(claude_analyzer, "_encode_image", lambda path: ("image/png", "AAAA"))
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Canned Claude responses
+# ---------------------------------------------------------------------------
+
+_PAYLOADS = {
+    "sat_valid": {
+        "length_m": 11.5,
+        "width_m": 8.2,
+        "building_shape": "rectangular",
+        "confidence": 0.75,
+        "reasoning": "Clear roof visible",
+    },
+    "sat_fenced": {
+        "length_m": 10.0,
+        "width_m": 7.0,
+        "building_shape": "rectangular",
+        "confidence": 0.6,
+        "reasoning": "Roof visible",
+    },
+    "sat_out_of_bounds": {
+        "length_m": 50.0,
+        "width_m": 2.0,
+        "building_shape": "rectangular",
+        "confidence": 0.8,
+        "reasoning": "Test",
+    },
+    "sat_single_unit": {
+        "length_m": 10.0,
+        "width_m": 7.0,
+        "building_shape": "rectangular",
+        "confidence": 0.7,
+        "reasoning": "Single unit",
+    },
+    "sat_clear_roof": {
+        "length_m": 10.0,
+        "width_m": 7.0,
+        "building_shape": "rectangular",
+        "confidence": 0.7,
+        "reasoning": "Clear roof",
+    },
+    "sv_semi_d": {
+        "construction_epoch": "1990_2000",
+        "building_type": "semi_d_length",
+        "estimated_storeys": 2,
+        "heating_system_guess": "gas_boiler",
+        "adjacent_side": "length",
+        "confidence": 0.7,
+        "reasoning": "PVC windows, cavity block walls",
+    },
+    "sv_oil_detached": {
+        "construction_epoch": "before_1980",
+        "building_type": "detached",
+        "estimated_storeys": 2,
+        "heating_system_guess": "oil_boiler",
+        "adjacent_side": "length",
+        "confidence": 0.85,
+        "reasoning": "Oil tank visible at rear, single-glazed windows",
+    },
+    "sv_mosaic": {
+        "construction_epoch": "before_1980",
+        "building_type": "detached",
+        "confidence": 0.8,
+        "reasoning": "Grid view",
+    },
+    "sv_terraced_units": {
+        "construction_epoch": "1990_2000",
+        "building_type": "terraced_length",
+        "estimated_storeys": 2,
+        "heating_system_guess": "gas_boiler",
+        "adjacent_side": "length",
+        "estimated_units_in_row": 5,
+        "confidence": 0.7,
+        "reasoning": "Row of 5 terraced houses",
+    },
+    "sv_no_unit_count": {
+        "construction_epoch": "before_1980",
+        "building_type": "detached",
+        "estimated_storeys": 2,
+        "heating_system_guess": "oil_boiler",
+        "adjacent_side": "length",
+        "confidence": 0.8,
+        "reasoning": "Detached house",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _response(key: str) -> str:
+    """JSON text for ``_PAYLOADS[key]``, serialised at most once per session."""
+    return json.dumps(_PAYLOADS[key])
+
+
+# ---------------------------------------------------------------------------
+# analyze_satellite() tests
+# ---------------------------------------------------------------------------
+
+class TestAnalyzeSatellite:
+    """Test the Claude Vision satellite analysis function."""
+
+    @pytest.mark.parametrize(
+        "response_text, expected",
+        [
+            pytest.param(
+                _response("sat_valid"),
+                dict(
+                    length_m=11.5, width_m=8.2, area_m2=round(11.5 * 8.2, 1),
+                    confidence=0.75, source="claude_vision",
+                    building_shape="rectangular",
+                ),
+                id="valid_response",
+            ),
+            pytest.param(
+                "This is not JSON at all",
+                dict(confidence=0, source="claude_vision"),
+                id="malformed_json_returns_zero_confidence",
+            ),
+            # JSON surrounded by a code fence and commentary is still parsed
+            pytest.param(
+                f"Here is my assessment:\n```json\n{_response('sat_fenced')}\n```\nHope this helps.",
+                dict(length_m=10.0, confidence=0.6),
+                id="json_wrapped_in_prose_and_fences",
+            ),
+            # Dimensions outside [4, 25] are clamped
+            pytest.param(
+                _response("sat_out_of_bounds"),
+                dict(length_m=25.0, width_m=4.0),  # clamped from 50 and 2
+                id="out_of_bounds_dimensions_clamped",
+            ),
+        ],
+    )
+    async def test_analyze_satellite(self, anthropic_factory, response_text, expected):
+        """Claude's reply text is parsed, validated and clamped into a FootprintResult."""
+        anthropic_factory(response_text)
+
+        result = await claude_analyzer.analyze_satellite("satellite.png", lat=53.35, zoom=20)
+
+        assert {field: getattr(result, field) for field in expected} == expected
+
+
+# ---------------------------------------------------------------------------
+# analyze_streetview() tests (multi-image)
+# ---------------------------------------------------------------------------
+
+class TestAnalyzeStreetview:
+    """Test the multi-image Street View analysis function."""
+
+    async def test_single_image_backward_compatible(self, anthropic_factory):
+        """Passing a single path (str) still works."""
+        anthropic_factory(_response("sv_semi_d"))
+
+        result = await claude_analyzer.analyze_streetview("streetview.jpg")
+
+        assert result.construction_epoch.value == "1990_2000"
+        assert result.building_type.value == "semi_d_length"
+        assert result.confidence == 0.7
+
+    async def test_multiple_images(self, anthropic_factory):
+        """Passing multiple images sends all to Claude."""
+        images = [f"sv_{i}.jpg" for i in range(4)]
+
+        calls = anthropic_factory(_response("sv_oil_detached"))
+
+        result = await claude_analyzer.analyze_streetview(images)
+
+        assert result.heating_system_guess.value == "oil_boiler"
+        assert result.confidence == 0.85
+
+        # Verify all 4 images were included in the API call
+        content_blocks = calls[-1]["messages"][0]["content"]
+        image_blocks = [b for b in content_blocks if b["type"] == "image"]
+        assert len(image_blocks) == 4
+
+    async def test_mosaic_sends_single_image(self, tmp_path, anthropic_factory):
+        """With mosaic=True, multiple views are stitched into one image block."""
+        images = []
+        for i in range(4):
+            img = tmp_path / f"sv_{i}.jpg"
+            Image.new("RGB", (640, 640), (40 * i, 80, 120)).save(img, format="JPEG")
+            images.append(img)
+
+        calls = anthropic_factory(_response("sv_mosaic"))
+
+        result = await claude_analyzer.analyze_streetview(images, mosaic=True)
+
+        assert result.confidence == 0.8
+
+        content_blocks = calls[-1]["messages"][0]["content"]
+        image_blocks = [b for b in content_blocks if b["type"] == "image"]
+        assert len(image_blocks) == 1
+        assert image_blocks[0]["source"]["media_type"] == "image/jpeg"
+        assert "2x2 grid" in content_blocks[-1]["text"]
+
+    async def test_mosaic_labels_follow_heading_index(self, tmp_path, anthropic_factory):
+        """A missing view keeps the others' labels and is not described to Claude."""
+        # streetview_1.jpg (the "right" view) failed to download
+        images = []
+        for i in (0, 2, 3):
+            img = tmp_path / f"streetview_{i}.jpg"
+            Image.new("RGB", (64, 64), (40 * i, 80, 120)).save(img, format="JPEG")
+            images.append(img)
+
+        calls = anthropic_factory(_response("sv_mosaic"))
+
+        await claude_analyzer.analyze_streetview(images, mosaic=True)
+
+        prompt_text = calls[-1]["messages"][0]["content"][-1]["text"]
+        assert "the back view (top-right)" in prompt_text
+        assert "the left view (bottom-left)" in prompt_text
+        assert "right view" not in prompt_text
+
+    async def test_mosaic_with_too_many_views_sends_separate_images(self, anthropic_factory):
+        """More views than grid tiles fall back to one image block each."""
+        images = [f"sv_{i}.jpg" for i in range(5)]
+        calls = anthropic_factory(_response("sv_mosaic"))
+
+        await claude_analyzer.analyze_streetview(images, mosaic=True)
+
+        content_blocks = calls[-1]["messages"][0]["content"]
+        assert sum(b["type"] == "image" for b in content_blocks) == 5
+
+    async def test_malformed_response_returns_defaults(self, anthropic_factory):
+        """Malformed JSON from streetview analysis returns safe defaults."""
+        anthropic_factory("Not JSON")
+
+        result = await claude_analyzer.analyze_streetview("streetview.jpg")
+
+        # Should return defaults, not crash
+        assert result.construction_epoch.value == "before_1980"
+        assert result.building_type.value == "detached"
+
+
+# ---------------------------------------------------------------------------
+# AsyncAnthropic client construction tests
+# ---------------------------------------------------------------------------
+
+class TestClientConstruction:
+    """The SDK's own retries are disabled in favour of _call_with_retry."""
+
+    @pytest.mark.parametrize(
+        "analyze, args",
+        [
+            pytest.param(claude_analyzer.analyze_satellite, ("satellite.png", 53.35), id="satellite"),
+            pytest.param(claude_analyzer.analyze_streetview, ("streetview.jpg",), id="streetview"),
+        ],
+    )
+    async def test_sdk_retries_disabled(self, anthropic_factory, analyze, args):
+        anthropic_factory(_response("sat_valid"))
+
+        await analyze(*args)
+
+        assert [kw["max_retries"] for kw in anthropic_factory.client_kwargs] == [0]
+
+
+# ---------------------------------------------------------------------------
+# _call_with_retry() tests
+# ---------------------------------------------------------------------------
+
+def _api_error(cls, status: int, headers: dict | None = None):
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return cls("error", response=response, body=None)
+
+
+class TestCallWithRetry:
+    """Test retry/backoff around Anthropic API calls."""
+
+    async def test_rate_limit_honours_retry_after(self, monkeypatch):
+        """A 429 is retried after the server-provided delay."""
+        call = AsyncMock(side_effect=[
+            _api_error(anthropic.RateLimitError, 429, {"retry-after": "2"}),
+            "ok",
+        ])
+        sleep = AsyncMock()
+        monkeypatch.setattr(claude_analyzer, "_sleep", sleep)
+
+        result = await claude_analyzer._call_with_retry(call)
+
+        assert result == "ok"
+        assert call.await_count == 2
+        sleep.assert_awaited_once_with(2.0)
+
+    async def test_server_error_retried_until_exhausted(self, monkeypatch):
+        """5xx errors are retried, then re-raised after max_attempts."""
+        call = AsyncMock(side_effect=_api_error(anthropic.InternalServerError, 500))
+        sleep = AsyncMock()
+        monkeypatch.setattr(claude_analyzer, "_sleep", sleep)
+
+        with pytest.raises(anthropic.InternalServerError):
+            await claude_analyzer._call_with_retry(call, max_attempts=3)
+
+        assert call.await_count == 3
+        assert sleep.await_count == 2
+
+    async def test_client_error_not_retried(self):
+        """4xx errors other than 429 fail immediately."""
+        call = AsyncMock(side_effect=_api_error(anthropic.BadRequestError, 400))
+        with pytest.raises(anthropic.BadRequestError):
+            await claude_analyzer._call_with_retry(call)
+
+        assert call.await_count == 1
+
+
+# ---------------------------------------------------------------------------
+# Terraced / unit-count tests
+# ---------------------------------------------------------------------------
+
+class TestTerraceUnitCount:
+    """Test estimated_units_in_row parsing from street view."""
+
+    async def test_terraced_with_unit_count(self, anthropic_factory):
+        """Verify estimated_units_in_row is parsed from Claude response."""
+        anthropic_factory(_response("sv_terraced_units"))
+
+        result = await claude_analyzer.analyze_streetview("streetview.jpg")
+
+        assert result.estimated_units_in_row == 5
+        assert result.building_type == BuildingType.TERRACED_LENGTH
+
+    async def test_missing_unit_count_defaults_to_one(self, anthropic_factory):
+        """Missing estimated_units_in_row defaults to 1."""
+        anthropic_factory(_response("sv_no_unit_count"))
+
+        result = await claude_analyzer.analyze_streetview("streetview.jpg")
+
+        assert result.estimated_units_in_row == 1
+
+
+class TestBuildingContextInSatellitePrompt:
+    """Test that building context is injected into satellite prompt."""
+
+    async def test_terraced_context_appended(self, anthropic_factory):
+        """Terraced building context is appended to satellite prompt."""
+        calls = anthropic_factory(_response("sat_single_unit"))
+
+        await claude_analyzer.analyze_satellite(
+            "satellite.png", lat=53.35, zoom=20,
+            building_type="terraced_length",
+            adjacent_side="length",
+            estimated_units_in_row=4,
+        )
+
+        prompt_text = calls[-1]["messages"][0]["content"][1]["text"]
+        assert "ONE unit" in prompt_text
+        assert "terraced row" in prompt_text
+        assert "4" in prompt_text
+
+    async def test_no_context_when_none(self, anthropic_factory):
+        """Prompt is unchanged when no building type is provided."""
+        calls = anthropic_factory(_response("sat_clear_roof"))
+
+        await claude_analyzer.analyze_satellite("satellite.png", lat=53.35, zoom=20)
+
+        prompt_text = calls[-1]["messages"][0]["content"][1]["text"]
+        assert "CRITICAL: Building Context" not in prompt_text
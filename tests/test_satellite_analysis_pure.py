@@ -0,0 +1,273 @@
+"""Tests for the pure pipeline helpers fed by the vision analysis.
+
+Footprint reconciliation, terrace correction and ``_build_input`` have no
+I/O and no mocks, so they live apart from the async Claude tests in
+``test_satellite_analysis_async.py`` and can be scheduled on their own
+xdist worker (``--dist loadfile``).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ber_automation.models import (
+    BuildingType,
+    ConstructionEpoch,
+    FootprintResult,
+    HeatingSystem,
+    PipelineResult,
+    StreetViewAnalysis,
+)
+from ber_automation.pipeline import BERPipeline
+
+pytestmark = pytest.mark.pure
+
+
+# ---------------------------------------------------------------------------
+# _reconcile_footprints() tests
+# ---------------------------------------------------------------------------
+
+# Parametrize cases are built once at import, not per test
+def _claude_fp(**kw) -> FootprintResult:
+    return FootprintResult(source="claude_vision", **kw)
+
+
+def _opencv_fp(**kw) -> FootprintResult:
+    return FootprintResult(source="opencv", **kw)
+
+
+class TestReconcileFootprints:
+    """Test footprint reconciliation logic."""
+
+    @pytest.mark.parametrize(
+        "claude_fp, opencv_fp, expected_source, expected_conf",
+        [
+            pytest.param(
+                _claude_fp(length_m=10.0, width_m=8.0, area_m2=80.0, confidence=0.7),
+                _opencv_fp(length_m=10.5, width_m=7.5, area_m2=78.75, confidence=0.5),
+                "claude_vision", 0.85,  # 0.7 + 0.15
+                id="agreement_boosts_confidence",
+            ),
+            pytest.param(
+                _claude_fp(length_m=10.0, width_m=8.0, area_m2=80.0, confidence=0.7),
+                _opencv_fp(length_m=20.0, width_m=15.0, area_m2=300.0, confidence=0.5),
+                "claude_vision", 0.7,  # no boost
+                id="disagreement_trusts_claude",
+            ),
+            pytest.param(
+                None,
+                _opencv_fp(length_m=10.0, width_m=8.0, area_m2=80.0, confidence=0.5),
+                "opencv", 0.5,
+                id="claude_fails_falls_back_to_opencv",
+            ),
+            pytest.param(None, None, None, None, id="both_fail_returns_none"),
+            pytest.param(
+                _claude_fp(length_m=10.0, width_m=8.0, area_m2=80.0, confidence=0.2),
+                _opencv_fp(length_m=11.0, width_m=7.5, area_m2=82.5, confidence=0.5),
+                "opencv", 0.5,
+                id="low_confidence_claude_falls_back_to_opencv",
+            ),
+        ],
+    )
+    def test_reconcile(self, claude_fp, opencv_fp, expected_source, expected_conf):
+        """Claude wins when confident (boosted on agreement), else OpenCV."""
+        result = BERPipeline._reconcile_footprints(claude_fp, opencv_fp)
+        if expected_source is None:
+            assert result is None
+        else:
+            assert result.source == expected_source
+            assert result.confidence == expected_conf
+
+
+# ---------------------------------------------------------------------------
+# _build_input() validation tests
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="class")
+def pipeline(tmp_path_factory) -> BERPipeline:
+    """One pipeline per test class; _build_input keeps no per-call state."""
+    return BERPipeline(output_dir=tmp_path_factory.mktemp("pipeline"))
+
+
+# Shared samples (FootprintResult is frozen); tests derive variants with
+# model_copy(update=...)
+_HIGH_CONF_CLAUDE_FP = FootprintResult(
+    length_m=12.0, width_m=9.0, area_m2=108.0,
+    confidence=0.8, source="claude_vision",
+)
+_HIGH_CONF_SA = StreetViewAnalysis(
+    construction_epoch=ConstructionEpoch("1990_2000"),
+    building_type=BuildingType("semi_d_length"),
+    estimated_storeys=2,
+    heating_system_guess=HeatingSystem("gas_boiler"),
+    confidence=0.7,
+    reasoning="Clear view of building",
+)
+# e.g. a vegetation-blocked view
+_LOW_CONF_SA = StreetViewAnalysis(
+    construction_epoch=ConstructionEpoch("after_2010"),
+    building_type=BuildingType("terraced_length"),
+    estimated_storeys=3,
+    heating_system_guess=HeatingSystem("heat_pump_air"),
+    confidence=0.1,
+    reasoning="Building not visible, obscured by vegetation",
+)
+
+
+class TestBuildInputValidation:
+    """Test the improved _build_input validation bounds."""
+
+    def _make_pipeline_result(self, footprint=None, street_analysis=None):
+        return PipelineResult(
+            eircode="D02X285",
+            footprint=footprint,
+            street_analysis=street_analysis,
+        )
+
+    def test_high_confidence_uses_footprint(self, pipeline):
+        """High confidence footprint dimensions are used."""
+        fp = _HIGH_CONF_CLAUDE_FP
+        pr = self._make_pipeline_result(footprint=fp)
+        building = pipeline._build_input(pr)
+        assert (building.length, building.width) == (12.0, 9.0)
+
+    def test_low_confidence_uses_defaults(self, pipeline):
+        """Low confidence footprint triggers default dimensions."""
+        fp = _HIGH_CONF_CLAUDE_FP.model_copy(update={"confidence": 0.3, "source": "opencv"})
+        pr = self._make_pipeline_result(footprint=fp)
+        building = pipeline._build_input(pr)
+        assert (building.length, building.width) == (10.0, 8.0)
+
+    def test_unreasonable_area_uses_defaults(self, pipeline):
+        """If area falls outside [20, 500] m2, defaults are used."""
+        fp = _HIGH_CONF_CLAUDE_FP.model_copy(
+            update={"length_m": 3.0, "width_m": 3.0, "area_m2": 9.0}
+        )
+        pr = self._make_pipeline_result(footprint=fp)
+        building = pipeline._build_input(pr)
+        # 3m clamped to 4m → area = 16 < 20 → defaults
+        assert (building.length, building.width) == (10.0, 8.0)
+
+    def test_dimensions_clamped_to_bounds(self, pipeline):
+        """Extreme dimensions are clamped to [4, 25] range."""
+        fp = _HIGH_CONF_CLAUDE_FP.model_copy(
+            update={"length_m": 30.0, "width_m": 2.0, "area_m2": 60.0}
+        )
+        pr = self._make_pipeline_result(footprint=fp)
+        building = pipeline._build_input(pr)
+        # 30 → 25, 2 → 4, area = 100 which is in [20,500] range
+        assert (building.length, building.width) == (25.0, 4.0)
+
+    def test_no_footprint_uses_defaults(self, pipeline):
+        """No footprint at all uses default 10x8."""
+        pr = self._make_pipeline_result()
+        building = pipeline._build_input(pr)
+        assert (building.length, building.width) == (10.0, 8.0)
+
+    def test_overrides_take_precedence(self, pipeline):
+        """User overrides override footprint dimensions."""
+        fp = _HIGH_CONF_CLAUDE_FP
+        pr = self._make_pipeline_result(footprint=fp)
+        building = pipeline._build_input(pr, overrides={"length": 15.0, "width": 10.0})
+        assert (building.length, building.width) == (15.0, 10.0)
+
+    def test_high_confidence_street_analysis_used(self, pipeline):
+        """High confidence street analysis parameters are applied."""
+        pr = self._make_pipeline_result(street_analysis=_HIGH_CONF_SA)
+        building = pipeline._build_input(pr)
+        assert (building.building_type, building.construction_epoch, building.heating_system) == (
+            BuildingType.SEMI_D_LENGTH, ConstructionEpoch.EPOCH_1990_2000, HeatingSystem.GAS_BOILER,
+        )
+
+    def test_low_confidence_street_analysis_ignored(self, pipeline):
+        """Low confidence street analysis (e.g. vegetation-blocked view) is ignored."""
+        pr = self._make_pipeline_result(street_analysis=_LOW_CONF_SA)
+        building = pipeline._build_input(pr)
+        # Should use defaults, not the low-confidence guesses
+        assert (building.building_type, building.construction_epoch, building.heating_system) == (
+            BuildingType.DETACHED, ConstructionEpoch.BEFORE_1980, HeatingSystem.GAS_BOILER,
+        )
+
+
+# ---------------------------------------------------------------------------
+# _correct_terrace_footprint() tests
+# ---------------------------------------------------------------------------
+
+# Shared samples; _make_fp/_make_sa derive variants with model_copy
+_TERRACE_FP = FootprintResult(
+    length_m=12.0, width_m=24.0, area_m2=288.0,
+    confidence=0.7, source="claude_vision",
+)
+_TERRACED_SA = StreetViewAnalysis(
+    building_type=BuildingType.TERRACED_LENGTH,
+    estimated_units_in_row=4,
+    adjacent_side="length",
+    confidence=0.7,
+)
+
+
+class TestCorrectTerraceFootprint:
+    """Test _correct_terrace_footprint safety net."""
+
+    def _make_fp(self, length=12.0, width=24.0, confidence=0.7):
+        return _TERRACE_FP.model_copy(update={
+            "length_m": length, "width_m": width,
+            "area_m2": round(length * width, 1),
+            "confidence": confidence,
+        })
+
+    def _make_sa(self, btype="terraced_length", units=4):
+        return _TERRACED_SA.model_copy(update={
+            "building_type": BuildingType(btype),
+            "estimated_units_in_row": units,
+        })
+
+    @pytest.mark.parametrize(
+        "fp_kw, sa_kw, expected_length, expected_width, expected_area, expected_conf",
+        [
+            # Party wall on length -> divide width by units
+            pytest.param(
+                dict(length=12.0, width=24.0), dict(btype="terraced_length", units=4),
+                12.0, 6.0, 72.0, 0.6,  # 24 / 4, confidence 0.7 - 0.1
+                id="terraced_length_corrects_width",
+            ),
+            # Party wall on width -> divide length by units
+            pytest.param(
+                dict(length=24.0, width=8.0), dict(btype="terraced_width", units=4),
+                6.0, 8.0, 48.0, 0.6,
+                id="terraced_width_corrects_length",
+            ),
+            pytest.param(
+                dict(length=12.0, width=10.0), dict(btype="detached", units=1),
+                12.0, 10.0, 120.0, 0.7,
+                id="detached_unchanged",
+            ),
+            # Semi-d with party wall on length -> divide width by 2
+            pytest.param(
+                dict(length=10.0, width=16.0), dict(btype="semi_d_length", units=2),
+                10.0, 8.0, 80.0, 0.6,
+                id="semi_d_length_halves_width",
+            ),
+            pytest.param(
+                dict(length=12.0, width=24.0, confidence=0.3), dict(btype="terraced_length", units=4),
+                12.0, 24.0, 288.0, 0.3,
+                id="low_confidence_skips_correction",
+            ),
+            # 12 / 4 = 3.0 < 4.0 -> skip
+            pytest.param(
+                dict(length=12.0, width=12.0), dict(btype="terraced_length", units=4),
+                12.0, 12.0, 144.0, 0.7,
+                id="too_small_per_unit_skips_correction",
+            ),
+        ],
+    )
+    def test_correct_terrace_footprint(
+        self, fp_kw, sa_kw, expected_length, expected_width, expected_area, expected_conf
+    ):
+        """Per-unit dimensions are derived from the party-wall side and unit count."""
+        result = BERPipeline._correct_terrace_footprint(
+            self._make_fp(**fp_kw), self._make_sa(**sa_kw)
+        )
+        assert (result.length_m, result.width_m, result.area_m2, result.confidence) == (
+            expected_length, expected_width, expected_area, expected_conf,
+        )
@@ -0,0 +1,88 @@
+"""Tests for the Claude Vision response cache."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from ber_automation.vision import claude_analyzer
+from ber_automation.vision.vision_cache import VisionCache, cache_key
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_same_inputs_same_key(self):
+        assert cache_key([b"img"], "prompt", "model", "1") == cache_key(
+            [b"img"], "prompt", "model", "1"
+        )
+
+    @pytest.mark.parametrize(
+        "images, prompt, model, version",
+        [
+            ([b"other"], "prompt", "model", "1"),
+            ([b"img"], "other prompt", "model", "1"),
+            ([b"img"], "prompt", "other-model", "1"),
+            ([b"img"], "prompt", "model", "2"),
+        ],
+    )
+    def test_any_change_changes_key(self, images, prompt, model, version):
+        assert cache_key(images, prompt, model, version) != cache_key(
+            [b"img"], "prompt", "model", "1"
+        )
+
+
+class TestVisionCache:
+    """Test the SQLite-backed store."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = VisionCache(tmp_path)
+        assert cache.get("k") is None
+        cache.set("k", '{"a": 1}')
+        assert cache.get("k") == '{"a": 1}'
+
+    def test_shared_across_threads(self, tmp_path):
+        """A cache created on one thread is usable from others (Streamlit reruns)."""
+        cache = VisionCache(tmp_path)
+        errors = []
+
+        def _run(fn):
+            def target():
+                try:
+                    fn()
+                except Exception as exc:  # surfaced in the main thread below
+                    errors.append(exc)
+            thread = threading.Thread(target=target)
+            thread.start()
+            thread.join()
+
+        _run(lambda: cache.set("k", "written elsewhere"))
+        result = []
+        _run(lambda: result.append(cache.get("k")))
+
+        assert errors == []
+        assert result == ["written elsewhere"]
+
+    async def test_analyze_satellite_hit_skips_api(self, tmp_path, monkeypatch, anthropic_factory):
+        """A second identical satellite analysis is served from the cache."""
+        calls = anthropic_factory(json.dumps({
+            "length_m": 11.5,
+            "width_m": 8.2,
+            "building_shape": "rectangular",
+            "confidence": 0.75,
+            "reasoning": "Clear roof visible",
+        }))
+        monkeypatch.setattr(anthropic_factory.settings, "vision_cache_dir", str(tmp_path / "cache"))
+
+        monkeypatch.setattr(claude_analyzer, "get_settings", lambda: anthropic_factory.settings)
+        monkeypatch.setattr(claude_analyzer, "anthropic", anthropic_factory.anthropic)
+        # The key hashes the encoded image, so a fixed encoding is enough
+        monkeypatch.setattr(claude_analyzer, "_encode_image", lambda path: ("image/png", "AAAA"))
+
+        first = await claude_analyzer.analyze_satellite("satellite.png", lat=53.35, zoom=20)
+        second = await claude_analyzer.analyze_satellite("satellite.png", lat=53.35, zoom=20)
+
+        assert len(calls) == 1
+        assert second == first